@@ -0,0 +1,91 @@
+# DATA VALIDATION - DECLARATIVE RULES, ONE VECTORIZED PASS
+import pandas as pd
+import numpy as np
+
+# Each rule is a plain dict. Supported kinds:
+#   {'name': ..., 'kind': 'foreign_key', 'column': 'customer_id', 'reference': customers['customer_id']}
+#   {'name': ..., 'kind': 'not_null', 'column': 'customer_state', 'max_null_pct': 0.0}
+#   {'name': ..., 'kind': 'range', 'column': 'price', 'min': 0, 'max': None}
+#   {'name': ..., 'kind': 'order', 'columns': ['order_purchase_timestamp', 'order_approved_at', ...]}
+# 'max_null_pct' / 'max_fail_pct' set how many failing rows (in %) a rule tolerates (default 0).
+
+MAX_RULES = 64
+
+
+def _rule_failures(df, rule):
+    """Return a boolean array that is True for every row breaking the rule."""
+    kind = rule['kind']
+
+    if kind == 'foreign_key':
+        col = df[rule['column']]
+        reference = pd.unique(pd.Series(rule['reference']).dropna())
+        return (col.notna() & ~col.isin(reference)).to_numpy()
+
+    if kind == 'not_null':
+        return df[rule['column']].isna().to_numpy()
+
+    if kind == 'range':
+        values = df[rule['column']]
+        failed = np.zeros(len(df), dtype=bool)
+        if rule.get('min') is not None:
+            failed |= (values < rule['min']).to_numpy()
+        if rule.get('max') is not None:
+            failed |= (values > rule['max']).to_numpy()
+        return failed
+
+    if kind == 'order':
+        # Every earlier timestamp must be <= every later one; NaT compares False so missing steps are skipped
+        columns = rule['columns']
+        failed = np.zeros(len(df), dtype=bool)
+        for i, earlier in enumerate(columns):
+            for later in columns[i + 1:]:
+                failed |= (df[earlier] > df[later]).to_numpy()
+        return failed
+
+    raise ValueError(f"Unknown rule kind: {kind}")
+
+
+def validate(df, rules):
+    """Evaluate all rules against df and return (row_bitmask, report).
+
+    row_bitmask is a uint64 array where bit i is set when the row breaks rules[i].
+    report is a DataFrame with one row per rule.
+    """
+    if len(rules) > MAX_RULES:
+        raise ValueError(f"At most {MAX_RULES} rules are supported, got {len(rules)}")
+
+    bitmask = np.zeros(len(df), dtype=np.uint64)
+    for bit, rule in enumerate(rules):
+        failed = _rule_failures(df, rule)
+        bitmask |= failed.astype(np.uint64) << np.uint64(bit)
+
+    # Count failures per rule from the distinct masks instead of rescanning the frame
+    masks, mask_counts = np.unique(bitmask, return_counts=True)
+    bits = np.arange(len(rules), dtype=np.uint64)
+    hits = (masks[:, None] >> bits[None, :]) & np.uint64(1)
+    failed_rows = (hits * mask_counts[:, None]).sum(axis=0).astype(int)
+
+    total = len(df)
+    report = pd.DataFrame({
+        'rule': [rule['name'] for rule in rules],
+        'kind': [rule['kind'] for rule in rules],
+        'failed_rows': failed_rows,
+        'failed_pct': (failed_rows / total * 100) if total else np.zeros(len(rules)),
+        'max_fail_pct': [rule.get('max_null_pct', rule.get('max_fail_pct', 0.0)) for rule in rules],
+    })
+    report['passed'] = report['failed_pct'] <= report['max_fail_pct']
+    return bitmask, report
+
+
+def failing_rows(df, bitmask, rules, rule_name):
+    """Return the rows of df that broke the named rule."""
+    bit = [rule['name'] for rule in rules].index(rule_name)
+    return df[(bitmask >> np.uint64(bit)) & np.uint64(1) == 1]
+
+
+def print_report(report):
+    """Print a validation report in the same format as the notebooks."""
+    print(f"\nValidation: {report['passed'].sum()}/{len(report)} rules passed")
+    for _, row in report.iterrows():
+        status = "OK  " if row['passed'] else "FAIL"
+        print(f"    [{status}] {row['rule']}: {row['failed_rows']:,} rows ({row['failed_pct']:.1f}%)")
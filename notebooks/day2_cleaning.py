@@ -2,6 +2,7 @@
 import pandas as pd
 import numpy as np
 import os
+from data_validation import validate, print_report
 
 print("="*70)
 print("DAY 2: DATA CLEANING")
@@ -73,6 +74,18 @@ print(f"\nKEY INSIGHT: {len(worst)} states have >20% late delivery!")
 for state, row in worst.iterrows():
     print(f"   {state}: {row['late_rate']:.1f}% late ({row['orders']:.0f} orders)")
 
+# Validate
+print("\nValidating cleaned orders...")
+validation_rules = [
+    {'name': 'orders -> customers', 'kind': 'foreign_key', 'column': 'customer_id', 'reference': customers['customer_id']},
+    {'name': 'purchase timestamp not null', 'kind': 'not_null', 'column': 'order_purchase_timestamp'},
+    {'name': 'purchase <= approved <= delivered', 'kind': 'order', 'columns': [
+        'order_purchase_timestamp', 'order_approved_at', 'order_delivered_customer_date',
+    ]},
+]
+_, validation_report = validate(orders_delivered, validation_rules)
+print_report(validation_report)
+
 # Save
 print("\nSaving files...")
 os.makedirs('data/processed', exist_ok=True)